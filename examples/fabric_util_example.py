@@ -12,7 +12,7 @@ import logging
 # Add the src directory to the path so we can import our module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from workspace_storage import FabricUtil
+from workspace_storage import FabricUtil, format_bytes
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -51,9 +51,7 @@ def main():
     print("\n3. Getting workspace total size...")
     try:
         workspace_size = fabric_util.get_workspace_total_size()
-        print(f"   Workspace size: {workspace_size:,} bytes")
-        print(f"   That's {workspace_size / (1024*1024):.2f} MB")
-        print(f"   Or {workspace_size / (1024*1024*1024):.2f} GB")
+        print(f"   Workspace size: {format_bytes(workspace_size)}")
     except Exception as e:
         print(f"   Error: {e}")
     
@@ -61,8 +59,7 @@ def main():
     print("\n4. Getting size of a specific workspace...")
     try:
         specific_workspace_size = fabric_util.get_workspace_total_size("workspace-1")
-        print(f"   Workspace 'workspace-1' size: {specific_workspace_size:,} bytes")
-        print(f"   That's {specific_workspace_size / (1024*1024):.2f} MB")
+        print(f"   Workspace 'workspace-1' size: {format_bytes(specific_workspace_size)}")
     except Exception as e:
         print(f"   Error: {e}")
     
@@ -70,9 +67,7 @@ def main():
     print("\n5. Getting tenant total size...")
     try:
         tenant_size = fabric_util.get_tenant_total_size()
-        print(f"   Tenant size: {tenant_size:,} bytes")
-        print(f"   That's {tenant_size / (1024*1024):.2f} MB")
-        print(f"   Or {tenant_size / (1024*1024*1024):.2f} GB")
+        print(f"   Tenant size: {format_bytes(tenant_size)}")
     except Exception as e:
         print(f"   Error: {e}")
     
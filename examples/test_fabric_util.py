@@ -12,7 +12,7 @@ import logging
 # Add the src directory to the path so we can import our module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from workspace_storage import FabricUtil
+from workspace_storage import FabricUtil, format_bytes
 
 # Configure logging to see debug information
 logging.basicConfig(level=logging.INFO)
@@ -43,17 +43,17 @@ def test_fabric_util():
     # Test 3: Get workspace total size
     print("\n3. Testing get_workspace_total_size()...")
     workspace_size = util.get_workspace_total_size()
-    print(f"   Workspace size: {workspace_size:,} bytes ({workspace_size / (1024*1024):.2f} MB)")
+    print(f"   Workspace size: {format_bytes(workspace_size)}")
     
     # Test 4: Get workspace total size with different workspace ID
     print("\n4. Testing get_workspace_total_size() with specific workspace ID...")
     workspace_size_2 = util.get_workspace_total_size("workspace-2")
-    print(f"   Workspace-2 size: {workspace_size_2:,} bytes ({workspace_size_2 / (1024*1024):.2f} MB)")
+    print(f"   Workspace-2 size: {format_bytes(workspace_size_2)}")
     
     # Test 5: Get tenant total size
     print("\n5. Testing get_tenant_total_size()...")
     tenant_size = util.get_tenant_total_size()
-    print(f"   Tenant size: {tenant_size:,} bytes ({tenant_size / (1024*1024):.2f} MB)")
+    print(f"   Tenant size: {format_bytes(tenant_size)}")
     
     # Test 6: Error handling - no workspace ID
     print("\n6. Testing error handling...")
@@ -13,7 +13,7 @@ import logging
 # Add the src directory to the path so we can import our module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from workspace_storage import FabricUtil
+from workspace_storage import FabricUtil, format_bytes
 
 # Configure logging to see the semantic-link integration messages
 logging.basicConfig(
@@ -48,7 +48,7 @@ def test_semantic_link_integration():
     print("\n3. Getting workspace total size (tries semantic-link API, falls back to placeholder)...")
     try:
         workspace_size = fabric_util.get_workspace_total_size()
-        print(f"   Workspace size: {workspace_size:,} bytes ({workspace_size / (1024*1024):.2f} MB)")
+        print(f"   Workspace size: {format_bytes(workspace_size)}")
         
         # Also test with specific workspace ID
         if workspaces:
@@ -62,7 +62,7 @@ def test_semantic_link_integration():
     print("\n4. Getting tenant total size (sums real workspace data when available)...")
     try:
         tenant_size = fabric_util.get_tenant_total_size()
-        print(f"   Tenant size: {tenant_size:,} bytes ({tenant_size / (1024*1024):.2f} MB)")
+        print(f"   Tenant size: {format_bytes(tenant_size)}")
     except Exception as e:
         print(f"   Error: {e}")
     
@@ -1,6 +1,6 @@
-from .fabric_util import FabricUtil
+from .fabric_util import FabricUtil, format_bytes
 
 def hello() -> str:
     return "Hello from workspace-storage!"
 
-__all__ = ["FabricUtil", "hello"]
+__all__ = ["FabricUtil", "format_bytes", "hello"]